@@ -0,0 +1,90 @@
+"""Password hashing helpers.
+
+Prefers a SIMD-accelerated bcrypt backend (AVX2 Blowfish lanes) when one is
+importable on this host, falling back to the stock `bcrypt` package. Both
+paths emit standard $2b$ hashes, so existing stored hashes stay verifiable
+regardless of which backend produced them.
+
+Hashing and verification run in a process pool so the ~200 ms of CPU-bound
+Blowfish work per call never blocks the event loop and scales across cores
+under concurrent auth load.
+"""
+
+import asyncio
+import base64
+import concurrent.futures
+import os
+
+import bcrypt
+
+# Optional accelerated backends, tried in order of preference:
+#  1. bcrypt_rs — a PyO3 extension that owns the buffers end-to-end and
+#     releases the GIL around the Blowfish key expansion, cutting per-call
+#     FFI overhead on top of the raw algorithm cost.
+#  2. bcrypt_avx — an AVX2-vectorized build (used only when the CPU
+#     advertises AVX2).
+# Stock bcrypt handles everything when neither extension is installed.
+_hashpw = bcrypt.hashpw
+_checkpw = bcrypt.checkpw
+
+try:
+    import bcrypt_rs
+
+    _hashpw = bcrypt_rs.hashpw
+    _checkpw = bcrypt_rs.checkpw
+except ImportError:
+    try:
+        import bcrypt_avx
+        from cpufeature import CPUFeature
+
+        if CPUFeature.get('AVX2'):
+            _hashpw = bcrypt_avx.hashpw_avx
+            _checkpw = bcrypt_avx.checkpw_avx
+    except ImportError:
+        pass
+
+
+BCRYPT_POOL = concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count())
+
+# bcrypt uses its own base64 alphabet; translate from the standard one
+_BCRYPT_B64 = bytes.maketrans(
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/",
+    b"./ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789",
+)
+
+_SALT_PREFIX = b"$2b$12$"
+_salt_pool = b""
+_salt_offset = 0
+
+
+def _gensalt() -> bytes:
+    """Build a $2b$12$ salt from a batched urandom pool.
+
+    One os.urandom syscall covers 256 salts instead of one per hash, which
+    matters under registration bursts. Each pool worker keeps its own pool.
+    """
+    global _salt_pool, _salt_offset
+    if _salt_offset >= len(_salt_pool):
+        _salt_pool = os.urandom(4096)
+        _salt_offset = 0
+    raw = _salt_pool[_salt_offset:_salt_offset + 16]
+    _salt_offset += 16
+    return _SALT_PREFIX + base64.b64encode(raw).translate(_BCRYPT_B64)[:22]
+
+
+def _hash_sync(password: str) -> str:
+    return _hashpw(password.encode('utf-8'), _gensalt()).decode('utf-8')
+
+
+def _verify_sync(plain_password: str, hashed_password: str) -> bool:
+    return _checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+
+async def hash_password(password: str) -> str:
+    return await asyncio.get_running_loop().run_in_executor(BCRYPT_POOL, _hash_sync, password)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await asyncio.get_running_loop().run_in_executor(
+        BCRYPT_POOL, _verify_sync, plain_password, hashed_password
+    )
@@ -1,17 +1,26 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Header, Request, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+from cachetools import TTLCache
+import asyncio
+import hashlib
 import os
+import hmac
 import logging
+import time
 from pathlib import Path
-from pydantic import BaseModel, Field, ConfigDict, EmailStr
-from typing import List, Optional
+from pydantic import BaseModel, Field, ConfigDict
+from typing import Annotated, List, Optional
+import msgspec
+import orjson
 import uuid
 from datetime import datetime, timezone, timedelta
-import bcrypt
-import jwt
+import base64
+
+from password import hash_password, verify_password
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -26,15 +35,43 @@ SECRET_KEY = os.environ.get('JWT_SECRET', 'your-secret-key-change-in-production'
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
 
-security = HTTPBearer()
+# Tokens are minted and verified by hand: the header is a compile-time
+# constant, payloads go through orjson, and the signature is a plain
+# HMAC-SHA256 (dispatched to SHA-NI by OpenSSL where available). Output is
+# standard HS256 JWT, interoperable with tokens minted by PyJWT.
+_JWT_SECRET = SECRET_KEY.encode()
+_JWT_HEADER_B64 = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
+
+def _b64url_decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+# Token-hash -> user cache so repeat requests from the same client skip the
+# HMAC verification and the Mongo lookup. Entries age out after 60 s, well
+# inside the token lifetime.
+_AUTH_CACHE = TTLCache(maxsize=10_000, ttl=60)
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 api_router = APIRouter(prefix="/api")
 
+# Second-resolution timestamp string, refreshed by a background task.
+# isoformat() construction shows up on write-heavy paths and these are audit
+# timestamps that don't need sub-second precision.
+_NOW_ISO = datetime.now(timezone.utc).isoformat()
+
+async def _refresh_now_iso():
+    global _NOW_ISO
+    while True:
+        _NOW_ISO = datetime.now(timezone.utc).isoformat()
+        await asyncio.sleep(1)
+
 # ============= MODELS =============
 
-class Address(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+# Request bodies and the documents built from them are msgspec Structs:
+# decode+validate happens in C while the JSON is parsed, with no
+# intermediate dict. Product/Review/ReturnRequest stay Pydantic since they
+# are only ever built server-side.
+
+class Address(msgspec.Struct):
     full_name: str
     phone: str
     address_line: str
@@ -42,26 +79,30 @@ class Address(BaseModel):
     state: str
     pincode: str
     is_default: bool = False
+    id: str = msgspec.field(default_factory=lambda: str(uuid.uuid4()))
+
+# Keeps the EmailStr-level format check the Pydantic models had; msgspec
+# enforces the pattern during decode, so a bad email still 422s
+Email = Annotated[str, msgspec.Meta(pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$")]
 
-class UserCreate(BaseModel):
-    email: EmailStr
+class UserCreate(msgspec.Struct):
+    email: Email
     password: str
     name: str
     phone: str
 
-class UserLogin(BaseModel):
-    email: EmailStr
+class UserLogin(msgspec.Struct):
+    email: Email
     password: str
 
-class User(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+class User(msgspec.Struct):
     email: str
     name: str
     phone: str
-    addresses: List[Address] = []
+    addresses: List[Address] = msgspec.field(default_factory=list)
     is_admin: bool = False
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    id: str = msgspec.field(default_factory=lambda: str(uuid.uuid4()))
+    created_at: str = msgspec.field(default_factory=lambda: _NOW_ISO)
 
 class Product(BaseModel):
     model_config = ConfigDict(extra="ignore")
@@ -76,66 +117,65 @@ class Product(BaseModel):
     stock: int
     rating: float = 0.0
     reviews_count: int = 0
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: str = Field(default_factory=lambda: _NOW_ISO)
 
-class ProductCreate(BaseModel):
+class ProductCreate(msgspec.Struct):
     name: str
     description: str
     price: float
-    original_price: Optional[float] = None
     category: str
     brand: str
     images: List[str]
     stock: int
+    original_price: Optional[float] = None
 
 class Review(BaseModel):
+    model_config = ConfigDict(extra="ignore")
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
     user_name: str
     product_id: str
     rating: int
     comment: str
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: str = Field(default_factory=lambda: _NOW_ISO)
 
-class ReviewCreate(BaseModel):
+class ReviewCreate(msgspec.Struct):
     rating: int
     comment: str
 
-class CartItem(BaseModel):
+class CartItem(msgspec.Struct):
     product_id: str
     quantity: int
 
-class Cart(BaseModel):
-    model_config = ConfigDict(extra="ignore")
+class Cart(msgspec.Struct):
     user_id: str
-    items: List[CartItem] = []
-    updated_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    items: List[CartItem] = msgspec.field(default_factory=list)
+    updated_at: str = msgspec.field(default_factory=lambda: _NOW_ISO)
 
-class OrderItem(BaseModel):
+class OrderItem(msgspec.Struct):
     product_id: str
     product_name: str
     product_image: str
     quantity: int
     price: float
 
-class Order(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+class Order(msgspec.Struct):
     user_id: str
     items: List[OrderItem]
     subtotal: float
     shipping: float
     discount: float
     total: float
-    status: str = "ordered"  # ordered, processed, shipped, out_for_delivery, delivered, cancelled
     payment_method: str
-    payment_status: str = "pending"  # pending, completed, failed
     shipping_address: Address
+    status: str = "ordered"  # ordered, processed, shipped, out_for_delivery, delivered, cancelled
+    payment_status: str = "pending"  # pending, completed, failed
     tracking_id: Optional[str] = None
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
-    updated_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    id: str = msgspec.field(default_factory=lambda: str(uuid.uuid4()))
+    created_at: str = msgspec.field(default_factory=lambda: _NOW_ISO)
+    updated_at: str = msgspec.field(default_factory=lambda: _NOW_ISO)
 
-class OrderCreate(BaseModel):
+class OrderCreate(msgspec.Struct):
     items: List[CartItem]
     shipping_address: Address
     payment_method: str
@@ -149,9 +189,9 @@ class ReturnRequest(BaseModel):
     reason: str
     status: str = "requested"  # requested, approved, picked_up, refunded
     refund_amount: float
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: str = Field(default_factory=lambda: _NOW_ISO)
 
-class ReturnCreate(BaseModel):
+class ReturnCreate(msgspec.Struct):
     order_id: str
     reason: str
 
@@ -160,41 +200,127 @@ class Category(BaseModel):
     name: str
     slug: str
 
-# ============= AUTH HELPERS =============
-
-def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+# Serialized-response cache for the hottest unauthenticated reads: the
+# category list and the unfiltered product listing. Entries hold the encoded
+# bytes plus an ETag so unchanged repeat visits get a 304.
+_LISTING_TTL = 30  # seconds
+_listing_cache = {}  # key -> (expires_at, body_bytes, etag)
+
+def _cached_listing(key):
+    entry = _listing_cache.get(key)
+    if entry and entry[0] > time.monotonic():
+        return entry
+    return None
+
+def _store_listing(key, body: bytes):
+    etag = '"%s"' % hashlib.blake2b(body, digest_size=8).hexdigest()
+    entry = (time.monotonic() + _LISTING_TTL, body, etag)
+    _listing_cache[key] = entry
+    return entry
+
+def _listing_response(entry, request: Request) -> Response:
+    _, body, etag = entry
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+def _invalidate_listings():
+    _listing_cache.clear()
+
+def stream_json_array(cursor):
+    """Stream a Motor cursor as a JSON array without materializing it.
+
+    to_list builds every document as a live Python dict before the encoder
+    runs; for 1000-document listings that is ~MB of heap per in-flight
+    request. Encoding per document keeps peak memory flat.
+    """
+    async def gen():
+        yield b"["
+        first = True
+        async for doc in cursor:
+            yield (b"" if first else b",") + orjson.dumps(doc)
+            first = False
+        yield b"]"
+    return StreamingResponse(gen(), media_type="application/json")
+
+def msgspec_body(cls):
+    """Dependency that decodes the request body straight into a Struct."""
+    async def dep(request: Request):
+        try:
+            return msgspec.json.decode(await request.body(), type=cls)
+        except msgspec.ValidationError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        except msgspec.DecodeError:
+            raise HTTPException(status_code=422, detail="Invalid JSON body")
+    return dep
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+# ============= AUTH HELPERS =============
 
 def create_access_token(data: dict) -> str:
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    to_encode.update({"exp": int(expire.timestamp())})
+    signing_input = _JWT_HEADER_B64 + b"." + base64.urlsafe_b64encode(orjson.dumps(to_encode)).rstrip(b"=")
+    signature = hmac.new(_JWT_SECRET, signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + base64.urlsafe_b64encode(signature).rstrip(b"=")).decode()
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
+def decode_access_token(token: str) -> dict:
+    """Verify an HS256 token and return its payload; 401 on any failure."""
     try:
-        token = credentials.credentials
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id = payload.get("sub")
-        if user_id is None:
+        signing_input, _, signature = token.encode().rpartition(b".")
+        expected = hmac.new(_JWT_SECRET, signing_input, hashlib.sha256).digest()
+        if not hmac.compare_digest(_b64url_decode(signature), expected):
             raise HTTPException(status_code=401, detail="Invalid token")
-        
-        user = await db.users.find_one({"id": user_id}, {"_id": 0})
-        if user is None:
-            raise HTTPException(status_code=401, detail="User not found")
-        return user
-    except jwt.ExpiredSignatureError:
+        payload = orjson.loads(_b64url_decode(signing_input.split(b".", 1)[1]))
+    except HTTPException:
+        raise
+    except Exception:
+        raise HTTPException(status_code=401, detail="Invalid token")
+    if payload.get("exp") is not None and payload["exp"] < time.time():
         raise HTTPException(status_code=401, detail="Token has expired")
-    except jwt.InvalidTokenError:
+    return payload
+
+def _auth_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+def _evict_auth_cache(authorization: str) -> None:
+    # Drop the caller's cached user after a profile write so the next
+    # authenticated read sees it immediately instead of after the TTL
+    _AUTH_CACHE.pop(_auth_cache_key(authorization[7:]), None)
+
+async def get_current_user(authorization: str = Header(default="", alias="Authorization")) -> dict:
+    # Slice the bearer token out of the header directly; the HTTPBearer
+    # dependency allocates a credentials model per request for the same work.
+    if not authorization.startswith("Bearer "):
+        raise HTTPException(status_code=403, detail="Not authenticated")
+    token = authorization[7:]
+    cache_key = _auth_cache_key(token)
+    cached = _AUTH_CACHE.get(cache_key)
+    if cached is not None:
+        # Copy so handlers that pop fields don't mutate the cached entry
+        return dict(cached)
+
+    payload = decode_access_token(token)
+    user_id = payload.get("sub")
+    if user_id is None:
         raise HTTPException(status_code=401, detail="Invalid token")
 
+    # password_hash never leaves the login path; project it out here
+    user = await db.users.find_one({"id": user_id}, {"_id": 0, "password_hash": 0})
+    if user is None:
+        raise HTTPException(status_code=401, detail="User not found")
+    _AUTH_CACHE[cache_key] = user
+    return dict(user)
+
+async def get_current_admin(current_user: dict = Depends(get_current_user)) -> dict:
+    if not current_user.get("is_admin"):
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return current_user
+
 # ============= AUTH ROUTES =============
 
 @api_router.post("/auth/register")
-async def register(user_data: UserCreate):
+async def register(user_data: UserCreate = Depends(msgspec_body(UserCreate))):
     existing_user = await db.users.find_one({"email": user_data.email})
     if existing_user:
         raise HTTPException(status_code=400, detail="Email already registered")
@@ -205,18 +331,16 @@ async def register(user_data: UserCreate):
         phone=user_data.phone
     )
     
-    user_dict = user.model_dump()
-    user_dict["password_hash"] = hash_password(user_data.password)
-    
-    await db.users.insert_one(user_dict)
+    user_dict = msgspec.to_builtins(user)
+    await db.users.insert_one({**user_dict, "password_hash": await hash_password(user_data.password)})
     
     token = create_access_token({"sub": user.id})
-    return {"token": token, "user": user}
+    return {"token": token, "user": user_dict}
 
 @api_router.post("/auth/login")
-async def login(login_data: UserLogin):
+async def login(login_data: UserLogin = Depends(msgspec_body(UserLogin))):
     user = await db.users.find_one({"email": login_data.email}, {"_id": 0})
-    if not user or not verify_password(login_data.password, user["password_hash"]):
+    if not user or not await verify_password(login_data.password, user["password_hash"]):
         raise HTTPException(status_code=401, detail="Invalid email or password")
     
     token = create_access_token({"sub": user["id"]})
@@ -225,19 +349,28 @@ async def login(login_data: UserLogin):
 
 @api_router.get("/auth/profile")
 async def get_profile(current_user: dict = Depends(get_current_user)):
-    current_user.pop("password_hash", None)
     return current_user
 
 @api_router.put("/auth/profile")
-async def update_profile(name: str, phone: str, current_user: dict = Depends(get_current_user)):
+async def update_profile(
+    name: str,
+    phone: str,
+    current_user: dict = Depends(get_current_user),
+    authorization: str = Header(default="", alias="Authorization"),
+):
     await db.users.update_one(
         {"id": current_user["id"]},
         {"$set": {"name": name, "phone": phone}}
     )
+    _evict_auth_cache(authorization)
     return {"message": "Profile updated successfully"}
 
 @api_router.post("/auth/address")
-async def add_address(address: Address, current_user: dict = Depends(get_current_user)):
+async def add_address(
+    address: Address = Depends(msgspec_body(Address)),
+    current_user: dict = Depends(get_current_user),
+    authorization: str = Header(default="", alias="Authorization"),
+):
     # If this is the first address or marked as default, set all others to non-default
     if address.is_default:
         await db.users.update_one(
@@ -247,22 +380,29 @@ async def add_address(address: Address, current_user: dict = Depends(get_current
     
     await db.users.update_one(
         {"id": current_user["id"]},
-        {"$push": {"addresses": address.model_dump()}}
+        {"$push": {"addresses": msgspec.to_builtins(address)}}
     )
-    return {"message": "Address added successfully", "address": address}
+    _evict_auth_cache(authorization)
+    return {"message": "Address added successfully", "address": msgspec.to_builtins(address)}
 
 @api_router.delete("/auth/address/{address_id}")
-async def delete_address(address_id: str, current_user: dict = Depends(get_current_user)):
+async def delete_address(
+    address_id: str,
+    current_user: dict = Depends(get_current_user),
+    authorization: str = Header(default="", alias="Authorization"),
+):
     await db.users.update_one(
         {"id": current_user["id"]},
         {"$pull": {"addresses": {"id": address_id}}}
     )
+    _evict_auth_cache(authorization)
     return {"message": "Address deleted successfully"}
 
 # ============= PRODUCT ROUTES =============
 
-@api_router.get("/products", response_model=List[Product])
+@api_router.get("/products")
 async def get_products(
+    request: Request,
     category: Optional[str] = None,
     brand: Optional[str] = None,
     min_price: Optional[float] = None,
@@ -270,6 +410,15 @@ async def get_products(
     sort: Optional[str] = None,
     search: Optional[str] = None
 ):
+    # The bare home-page listing is served from the TTL cache
+    unfiltered = not (category or brand or search or sort) and min_price is None and max_price is None
+    if unfiltered:
+        entry = _cached_listing("products")
+        if entry is None:
+            docs = await db.products.find({}, {"_id": 0}).sort("created_at", -1).to_list(None)
+            entry = _store_listing("products", orjson.dumps(docs))
+        return _listing_response(entry, request)
+
     query = {}
     
     if category:
@@ -283,10 +432,15 @@ async def get_products(
         if max_price is not None:
             query["price"]["$lte"] = max_price
     if search:
-        query["$or"] = [
-            {"name": {"$regex": search, "$options": "i"}},
-            {"description": {"$regex": search, "$options": "i"}}
-        ]
+        if len(search) >= 3:
+            # Inverted-index lookup via the text index on name/description
+            query["$text"] = {"$search": search}
+        else:
+            # Too short to tokenize usefully; fall back to the regex scan
+            query["$or"] = [
+                {"name": {"$regex": search, "$options": "i"}},
+                {"description": {"$regex": search, "$options": "i"}}
+            ]
     
     sort_dict = {}
     if sort == "price_low":
@@ -298,29 +452,34 @@ async def get_products(
     else:
         sort_dict["created_at"] = -1
     
-    products = await db.products.find(query, {"_id": 0}).sort(list(sort_dict.items())).to_list(1000)
-    return products
+    return stream_json_array(db.products.find(query, {"_id": 0}).sort(list(sort_dict.items())))
 
-@api_router.get("/products/{product_id}", response_model=Product)
+@api_router.get("/products/{product_id}")
 async def get_product(product_id: str):
     product = await db.products.find_one({"id": product_id}, {"_id": 0})
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
     return product
 
-@api_router.get("/categories", response_model=List[Category])
-async def get_categories():
-    # Get unique categories from products
-    categories = await db.products.distinct("category")
-    return [{"id": cat, "name": cat, "slug": cat.lower().replace(" ", "-")} for cat in categories]
+@api_router.get("/categories")
+async def get_categories(request: Request):
+    entry = _cached_listing("categories")
+    if entry is None:
+        # Get unique categories from products
+        categories = await db.products.distinct("category")
+        body = orjson.dumps([
+            {"id": cat, "name": cat, "slug": cat.lower().replace(" ", "-")} for cat in categories
+        ])
+        entry = _store_listing("categories", body)
+    return _listing_response(entry, request)
 
 @api_router.post("/products/{product_id}/review")
-async def add_review(product_id: str, review_data: ReviewCreate, current_user: dict = Depends(get_current_user)):
+async def add_review(product_id: str, review_data: ReviewCreate = Depends(msgspec_body(ReviewCreate)), current_user: dict = Depends(get_current_user)):
     product = await db.products.find_one({"id": product_id})
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
     
-    review = Review(
+    review = Review.model_construct(
         user_id=current_user["id"],
         user_name=current_user["name"],
         product_id=product_id,
@@ -330,21 +489,23 @@ async def add_review(product_id: str, review_data: ReviewCreate, current_user: d
     
     await db.reviews.insert_one(review.model_dump())
     
-    # Update product rating
-    reviews = await db.reviews.find({"product_id": product_id}).to_list(1000)
-    avg_rating = sum(r["rating"] for r in reviews) / len(reviews)
-    
+    # Update product rating server-side instead of pulling every review
+    agg = await db.reviews.aggregate([
+        {"$match": {"product_id": product_id}},
+        {"$group": {"_id": None, "avg": {"$avg": "$rating"}, "n": {"$sum": 1}}}
+    ]).to_list(1)
+    avg_rating, reviews_count = agg[0]["avg"], agg[0]["n"]
+
     await db.products.update_one(
         {"id": product_id},
-        {"$set": {"rating": round(avg_rating, 1), "reviews_count": len(reviews)}}
+        {"$set": {"rating": round(avg_rating, 1), "reviews_count": reviews_count}}
     )
     
     return {"message": "Review added successfully", "review": review}
 
-@api_router.get("/products/{product_id}/reviews", response_model=List[Review])
+@api_router.get("/products/{product_id}/reviews")
 async def get_product_reviews(product_id: str):
-    reviews = await db.reviews.find({"product_id": product_id}, {"_id": 0}).to_list(1000)
-    return reviews
+    return stream_json_array(db.reviews.find({"product_id": product_id}, {"_id": 0}))
 
 # ============= CART ROUTES =============
 
@@ -354,20 +515,20 @@ async def get_cart(current_user: dict = Depends(get_current_user)):
     if not cart:
         return {"items": []}
     
-    # Populate product details
-    cart_items = []
-    for item in cart.get("items", []):
-        product = await db.products.find_one({"id": item["product_id"]}, {"_id": 0})
-        if product:
-            cart_items.append({
-                **item,
-                "product": product
-            })
-    
+    # Populate product details with a single batched lookup
+    ids = [item["product_id"] for item in cart.get("items", [])]
+    products = {p["id"]: p async for p in db.products.find({"id": {"$in": ids}}, {"_id": 0})}
+
+    cart_items = [
+        {**item, "product": products[item["product_id"]]}
+        for item in cart.get("items", [])
+        if item["product_id"] in products
+    ]
+
     return {"items": cart_items}
 
 @api_router.post("/cart/add")
-async def add_to_cart(item: CartItem, current_user: dict = Depends(get_current_user)):
+async def add_to_cart(item: CartItem = Depends(msgspec_body(CartItem)), current_user: dict = Depends(get_current_user)):
     product = await db.products.find_one({"id": item.product_id})
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
@@ -375,30 +536,23 @@ async def add_to_cart(item: CartItem, current_user: dict = Depends(get_current_u
     if product["stock"] < item.quantity:
         raise HTTPException(status_code=400, detail="Insufficient stock")
     
-    cart = await db.carts.find_one({"user_id": current_user["id"]})
-    
-    if not cart:
-        cart = {"user_id": current_user["id"], "items": []}
-        await db.carts.insert_one(cart)
-    
-    # Check if product already in cart
-    existing_item = next((i for i in cart["items"] if i["product_id"] == item.product_id), None)
-    
-    if existing_item:
-        await db.carts.update_one(
-            {"user_id": current_user["id"], "items.product_id": item.product_id},
-            {"$inc": {"items.$.quantity": item.quantity}, "$set": {"updated_at": datetime.now(timezone.utc).isoformat()}}
-        )
-    else:
+    # Bump an existing cart line atomically; one round-trip in the common case
+    result = await db.carts.update_one(
+        {"user_id": current_user["id"], "items.product_id": item.product_id},
+        {"$inc": {"items.$.quantity": item.quantity}, "$set": {"updated_at": _NOW_ISO}}
+    )
+    if result.matched_count == 0:
+        # No existing line (or no cart yet): push it, creating the cart on first add
         await db.carts.update_one(
             {"user_id": current_user["id"]},
-            {"$push": {"items": item.model_dump()}, "$set": {"updated_at": datetime.now(timezone.utc).isoformat()}}
+            {"$push": {"items": msgspec.to_builtins(item)}, "$set": {"updated_at": _NOW_ISO}},
+            upsert=True
         )
-    
+
     return {"message": "Item added to cart"}
 
 @api_router.put("/cart/update")
-async def update_cart(item: CartItem, current_user: dict = Depends(get_current_user)):
+async def update_cart(item: CartItem = Depends(msgspec_body(CartItem)), current_user: dict = Depends(get_current_user)):
     if item.quantity == 0:
         await db.carts.update_one(
             {"user_id": current_user["id"]},
@@ -407,7 +561,7 @@ async def update_cart(item: CartItem, current_user: dict = Depends(get_current_u
     else:
         await db.carts.update_one(
             {"user_id": current_user["id"], "items.product_id": item.product_id},
-            {"$set": {"items.$.quantity": item.quantity, "updated_at": datetime.now(timezone.utc).isoformat()}}
+            {"$set": {"items.$.quantity": item.quantity, "updated_at": _NOW_ISO}}
         )
     return {"message": "Cart updated"}
 
@@ -435,12 +589,10 @@ async def get_wishlist(current_user: dict = Depends(get_current_user)):
     if not wishlist:
         return {"products": []}
     
-    products = []
-    for product_id in wishlist.get("product_ids", []):
-        product = await db.products.find_one({"id": product_id}, {"_id": 0})
-        if product:
-            products.append(product)
-    
+    product_ids = wishlist.get("product_ids", [])
+    found = {p["id"]: p async for p in db.products.find({"id": {"$in": product_ids}}, {"_id": 0})}
+    products = [found[pid] for pid in product_ids if pid in found]
+
     return {"products": products}
 
 @api_router.post("/wishlist/add/{product_id}")
@@ -467,19 +619,22 @@ async def remove_from_wishlist(product_id: str, current_user: dict = Depends(get
 # ============= ORDER ROUTES =============
 
 @api_router.post("/orders/create")
-async def create_order(order_data: OrderCreate, current_user: dict = Depends(get_current_user)):
+async def create_order(order_data: OrderCreate = Depends(msgspec_body(OrderCreate)), current_user: dict = Depends(get_current_user)):
     if not order_data.items:
         raise HTTPException(status_code=400, detail="Cart is empty")
     
-    # Build order items with product details
+    # Build order items with product details, fetched in one batched query
+    ids = [item.product_id for item in order_data.items]
+    products = {p["id"]: p async for p in db.products.find({"id": {"$in": ids}})}
+
     order_items = []
     subtotal = 0.0
-    
+
     for item in order_data.items:
-        product = await db.products.find_one({"id": item.product_id})
+        product = products.get(item.product_id)
         if not product:
             raise HTTPException(status_code=404, detail=f"Product {item.product_id} not found")
-        
+
         if product["stock"] < item.quantity:
             raise HTTPException(status_code=400, detail=f"Insufficient stock for {product['name']}")
         
@@ -514,22 +669,29 @@ async def create_order(order_data: OrderCreate, current_user: dict = Depends(get
         tracking_id=f"TRK{uuid.uuid4().hex[:10].upper()}"
     )
     
-    await db.orders.insert_one(order.model_dump())
-    
-    # Update product stock
-    for item in order_items:
-        await db.products.update_one(
-            {"id": item.product_id},
-            {"$inc": {"stock": -item.quantity}}
+    order_doc = msgspec.to_builtins(order)
+
+    # Decrement stock in one batched write; the $gte guard keeps concurrent
+    # orders from driving stock negative after the validation pass
+    stock_ops = [
+        UpdateOne(
+            {"id": order_item.product_id, "stock": {"$gte": order_item.quantity}},
+            {"$inc": {"stock": -order_item.quantity}}
+        )
+        for order_item in order_items
+    ]
+
+    # Order insert, stock decrements and cart clear are independent writes
+    await asyncio.gather(
+        db.orders.insert_one(dict(order_doc)),
+        db.products.bulk_write(stock_ops, ordered=False),
+        db.carts.update_one(
+            {"user_id": current_user["id"]},
+            {"$set": {"items": []}}
         )
-    
-    # Clear cart
-    await db.carts.update_one(
-        {"user_id": current_user["id"]},
-        {"$set": {"items": []}}
     )
-    
-    return order
+
+    return order_doc
 
 @api_router.post("/orders/{order_id}/payment")
 async def process_payment(order_id: str, current_user: dict = Depends(get_current_user)):
@@ -545,12 +707,11 @@ async def process_payment(order_id: str, current_user: dict = Depends(get_curren
     
     return {"message": "Payment successful", "order_id": order_id}
 
-@api_router.get("/orders", response_model=List[Order])
+@api_router.get("/orders")
 async def get_orders(current_user: dict = Depends(get_current_user)):
-    orders = await db.orders.find({"user_id": current_user["id"]}, {"_id": 0}).sort("created_at", -1).to_list(1000)
-    return orders
+    return stream_json_array(db.orders.find({"user_id": current_user["id"]}, {"_id": 0}).sort("created_at", -1))
 
-@api_router.get("/orders/{order_id}", response_model=Order)
+@api_router.get("/orders/{order_id}")
 async def get_order(order_id: str, current_user: dict = Depends(get_current_user)):
     order = await db.orders.find_one({"id": order_id, "user_id": current_user["id"]}, {"_id": 0})
     if not order:
@@ -560,7 +721,7 @@ async def get_order(order_id: str, current_user: dict = Depends(get_current_user
 # ============= RETURN ROUTES =============
 
 @api_router.post("/returns/create")
-async def create_return(return_data: ReturnCreate, current_user: dict = Depends(get_current_user)):
+async def create_return(return_data: ReturnCreate = Depends(msgspec_body(ReturnCreate)), current_user: dict = Depends(get_current_user)):
     order = await db.orders.find_one({"id": return_data.order_id, "user_id": current_user["id"]})
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
@@ -575,7 +736,7 @@ async def create_return(return_data: ReturnCreate, current_user: dict = Depends(
     if days_since_order > 7:
         raise HTTPException(status_code=400, detail="Return window has expired")
     
-    return_request = ReturnRequest(
+    return_request = ReturnRequest.model_construct(
         order_id=return_data.order_id,
         user_id=current_user["id"],
         reason=return_data.reason,
@@ -592,70 +753,67 @@ async def create_return(return_data: ReturnCreate, current_user: dict = Depends(
     
     return return_request
 
-@api_router.get("/returns", response_model=List[ReturnRequest])
+@api_router.get("/returns")
 async def get_returns(current_user: dict = Depends(get_current_user)):
-    returns = await db.returns.find({"user_id": current_user["id"]}, {"_id": 0}).to_list(1000)
-    return returns
+    return stream_json_array(db.returns.find({"user_id": current_user["id"]}, {"_id": 0}))
 
 # ============= ADMIN ROUTES =============
 
 @api_router.post("/admin/products")
-async def create_product(product_data: ProductCreate, current_user: dict = Depends(get_current_user)):
-    if not current_user.get("is_admin"):
-        raise HTTPException(status_code=403, detail="Admin access required")
-    
-    product = Product(**product_data.model_dump())
+async def create_product(product_data: ProductCreate = Depends(msgspec_body(ProductCreate)), current_user: dict = Depends(get_current_admin)):
+    product = Product.model_construct(**msgspec.to_builtins(product_data))
     await db.products.insert_one(product.model_dump())
+    _invalidate_listings()
     return product
 
 @api_router.put("/admin/products/{product_id}")
-async def update_product(product_id: str, product_data: ProductCreate, current_user: dict = Depends(get_current_user)):
-    if not current_user.get("is_admin"):
-        raise HTTPException(status_code=403, detail="Admin access required")
-    
+async def update_product(product_id: str, product_data: ProductCreate = Depends(msgspec_body(ProductCreate)), current_user: dict = Depends(get_current_admin)):
     await db.products.update_one(
         {"id": product_id},
-        {"$set": product_data.model_dump()}
+        {"$set": msgspec.to_builtins(product_data)}
     )
+    _invalidate_listings()
     return {"message": "Product updated successfully"}
 
 @api_router.delete("/admin/products/{product_id}")
-async def delete_product(product_id: str, current_user: dict = Depends(get_current_user)):
-    if not current_user.get("is_admin"):
-        raise HTTPException(status_code=403, detail="Admin access required")
-    
+async def delete_product(product_id: str, current_user: dict = Depends(get_current_admin)):
     await db.products.delete_one({"id": product_id})
+    _invalidate_listings()
     return {"message": "Product deleted successfully"}
 
 @api_router.put("/admin/orders/{order_id}/status")
-async def update_order_status(order_id: str, status: str, current_user: dict = Depends(get_current_user)):
-    if not current_user.get("is_admin"):
-        raise HTTPException(status_code=403, detail="Admin access required")
-    
+async def update_order_status(order_id: str, status: str, current_user: dict = Depends(get_current_admin)):
     await db.orders.update_one(
         {"id": order_id},
-        {"$set": {"status": status, "updated_at": datetime.now(timezone.utc).isoformat()}}
+        {"$set": {"status": status, "updated_at": _NOW_ISO}}
     )
     return {"message": "Order status updated"}
 
-@api_router.get("/admin/orders", response_model=List[Order])
-async def get_all_orders(current_user: dict = Depends(get_current_user)):
-    if not current_user.get("is_admin"):
-        raise HTTPException(status_code=403, detail="Admin access required")
-    
-    orders = await db.orders.find({}, {"_id": 0}).sort("created_at", -1).to_list(1000)
-    return orders
+@api_router.get("/admin/orders")
+async def get_all_orders(current_user: dict = Depends(get_current_admin)):
+    return stream_json_array(db.orders.find({}, {"_id": 0}).sort("created_at", -1))
 
 @api_router.get("/admin/analytics")
-async def get_analytics(current_user: dict = Depends(get_current_user)):
-    if not current_user.get("is_admin"):
-        raise HTTPException(status_code=403, detail="Admin access required")
-    
-    total_orders = await db.orders.count_documents({})
-    total_revenue = sum([order["total"] for order in await db.orders.find({"payment_status": "completed"}).to_list(10000)])
-    total_products = await db.products.count_documents({})
-    total_users = await db.users.count_documents({})
-    
+async def get_analytics(current_user: dict = Depends(get_current_admin)):
+    # Revenue and order count in one server-side pipeline; estimated counts
+    # are O(1) metadata reads instead of collection scans
+    facet_result, total_products, total_users = await asyncio.gather(
+        db.orders.aggregate([
+            {"$facet": {
+                "revenue": [
+                    {"$match": {"payment_status": "completed"}},
+                    {"$group": {"_id": None, "sum": {"$sum": "$total"}}}
+                ],
+                "orders": [{"$count": "n"}]
+            }}
+        ]).to_list(1),
+        db.products.estimated_document_count(),
+        db.users.estimated_document_count()
+    )
+    facets = facet_result[0]
+    total_orders = facets["orders"][0]["n"] if facets["orders"] else 0
+    total_revenue = facets["revenue"][0]["sum"] if facets["revenue"] else 0.0
+
     return {
         "total_orders": total_orders,
         "total_revenue": total_revenue,
@@ -789,7 +947,7 @@ async def seed_data():
     admin_user = {
         "id": str(uuid.uuid4()),
         "email": "admin@shop.com",
-        "password_hash": hash_password("admin123"),
+        "password_hash": await hash_password("admin123"),
         "name": "Admin User",
         "phone": "1234567890",
         "addresses": [],
@@ -798,6 +956,7 @@ async def seed_data():
     }
     
     await db.users.insert_one(admin_user)
+    _invalidate_listings()
     
     return {"message": "Database seeded successfully", "products_count": len(products)}
 
@@ -817,6 +976,26 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def start_clock():
+    asyncio.create_task(_refresh_now_iso())
+
+@app.on_event("startup")
+async def create_indexes():
+    # Every query filters on one of these fields; without indexes Mongo
+    # falls back to a collection scan that grows with the data.
+    await db.users.create_index("email", unique=True)
+    await db.users.create_index("id", unique=True)
+    await db.products.create_index("id", unique=True)
+    await db.products.create_index([("category", 1), ("price", 1)])
+    await db.products.create_index([("brand", 1)])
+    await db.products.create_index([("name", "text"), ("description", "text")])
+    await db.orders.create_index([("user_id", 1), ("created_at", -1)])
+    await db.reviews.create_index("product_id")
+    await db.carts.create_index("user_id", unique=True)
+    await db.wishlists.create_index("user_id", unique=True)
+    await db.returns.create_index("user_id")
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
     client.close()
\ No newline at end of file
@@ -1,82 +1,147 @@
-import requests
+import asyncio
+import io
+import httpx
+import orjson
 import sys
-import json
-from datetime import datetime
+import uuid
+from types import MappingProxyType
 
 class ECommerceAPITester:
     def __init__(self, base_url="https://buy-sphere-2.preview.emergentagent.com"):
         self.base_url = base_url
         self.api_url = f"{base_url}/api"
+        self.session = None
         self.token = None
         self.admin_token = None
         self.user_id = None
         self.admin_id = None
-        self.tests_run = 0
-        self.tests_passed = 0
-        self.test_results = []
+        self._pass_names = []
+        self.failed_tests = []
         self.created_product_id = None
         self.created_order_id = None
+        self._products_cache = None
+        self._shipping_address = None
+        self._out = io.StringIO()
+        self._base_headers = MappingProxyType({'Content-Type': 'application/json'})
+        self._user_headers = self._base_headers
+        self._admin_headers = self._base_headers
+
+    async def __aenter__(self):
+        # HTTP/2 multiplexes every gathered request as interleaved frames on
+        # one TLS connection, so concurrent sections share a single handshake
+        # instead of opening a connection each. Keep-alive limits below are
+        # the HTTP/1.1 fallback for servers that don't negotiate h2.
+        # base_url lets run_test pass endpoints as relative paths; the
+        # client parses and caches the base once instead of re-parsing a
+        # freshly built absolute URL on every call
+        self.session = httpx.AsyncClient(
+            base_url=self.api_url + "/",
+            http2=True,
+            # Tight connect bound makes hung DNS or TCP setup fail fast
+            # instead of eating the total budget
+            timeout=httpx.Timeout(10.0, connect=2.0),
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.session.aclose()
+
+    def _print(self, line=""):
+        """Buffer output; one write() syscall per flush instead of per line"""
+        self._out.write(line + "\n")
+
+    def _flush_output(self):
+        sys.stdout.write(self._out.getvalue())
+        sys.stdout.flush()
+        self._out.seek(0)
+        self._out.truncate(0)
+
+    def _rebuild_headers(self):
+        """Rebuild the immutable header maps after a token changes"""
+        base = dict(self._base_headers)
+        self._user_headers = MappingProxyType(
+            {**base, 'Authorization': f'Bearer {self.token}'} if self.token else base
+        )
+        self._admin_headers = MappingProxyType(
+            {**base, 'Authorization': f'Bearer {self.admin_token}'} if self.admin_token else base
+        )
 
     def log_test(self, name, success, details=""):
-        """Log test result"""
-        self.tests_run += 1
+        """Log test result
+
+        Passes only need the name; the full detail dict is kept for
+        failures alone, so the common case stays one small append.
+        """
         if success:
-            self.tests_passed += 1
-            print(f"✅ {name}")
+            self._pass_names.append(name)
+            self._print(f"✅ {name}")
         else:
-            print(f"❌ {name} - {details}")
-        
-        self.test_results.append({
-            "test": name,
-            "success": success,
-            "details": details
-        })
+            self._print(f"❌ {name} - {details}")
+            self.failed_tests.append({"test": name, "details": details})
 
-    def run_test(self, name, method, endpoint, expected_status, data=None, headers=None, use_admin=False):
+    async def run_test(self, name, method, endpoint, expected_status, data=None, headers=None, use_admin=False, want_body=False):
         """Run a single API test"""
-        url = f"{self.api_url}/{endpoint}"
-        test_headers = {'Content-Type': 'application/json'}
-        
-        # Add authentication if available
+        # Select a pre-built header map; only copy when a caller overrides
         if use_admin and self.admin_token:
-            test_headers['Authorization'] = f'Bearer {self.admin_token}'
+            test_headers = self._admin_headers
         elif self.token:
-            test_headers['Authorization'] = f'Bearer {self.token}'
+            test_headers = self._user_headers
+        else:
+            test_headers = self._base_headers
             
         if headers:
-            test_headers.update(headers)
+            test_headers = {**test_headers, **headers}
+
+        # Serialize once with orjson rather than going through the json= path;
+        # Content-Type is already set on the headers
+        body = orjson.dumps(data) if data is not None else None
 
         try:
-            if method == 'GET':
-                response = requests.get(url, headers=test_headers, timeout=10)
-            elif method == 'POST':
-                response = requests.post(url, json=data, headers=test_headers, timeout=10)
-            elif method == 'PUT':
-                response = requests.put(url, json=data, headers=test_headers, timeout=10)
-            elif method == 'DELETE':
-                response = requests.delete(url, headers=test_headers, timeout=10)
+            if want_body:
+                response = await self.session.request(
+                    method, endpoint, content=body, headers=test_headers
+                )
+                raw = response.content
+            else:
+                # Most callers only check the status; stream the request and
+                # drop the payload without draining or decoding it. On h2
+                # the early close is just a stream reset, not a lost
+                # connection. Failures still read the body for the detail.
+                async with self.session.stream(
+                    method, endpoint, content=body, headers=test_headers
+                ) as response:
+                    raw = b"" if response.status_code == expected_status else await response.aread()
 
             success = response.status_code == expected_status
             details = f"Status: {response.status_code}"
-            
+
             if not success:
                 try:
-                    error_detail = response.json().get('detail', 'Unknown error')
+                    error_detail = orjson.loads(raw).get('detail', 'Unknown error')
                     details += f", Error: {error_detail}"
                 except:
-                    details += f", Response: {response.text[:100]}"
+                    details += f", Response: {raw[:100].decode('utf-8', 'replace')}"
 
             self.log_test(name, success, details)
-            return success, response.json() if success and response.text else {}
+            return success, orjson.loads(raw) if success and raw else {}
 
         except Exception as e:
             self.log_test(name, False, f"Exception: {str(e)}")
             return False, {}
 
-    def test_seed_data(self):
+    async def _get_products(self, name="Get Products for Testing"):
+        """Fetch the product list once and reuse it across sections"""
+        if self._products_cache is None:
+            success, response = await self.run_test(name, "GET", "products", 200, want_body=True)
+            if success and response:
+                self._products_cache = response
+        return self._products_cache or []
+
+    async def test_seed_data(self):
         """Test seeding initial data"""
-        print("\n🌱 Testing Data Seeding...")
-        success, response = self.run_test(
+        self._print("\n🌱 Testing Data Seeding...")
+        success, response = await self.run_test(
             "Seed Database",
             "POST",
             "seed",
@@ -84,119 +149,117 @@ class ECommerceAPITester:
         )
         return success
 
-    def test_authentication(self):
+    async def test_authentication(self):
         """Test user authentication"""
-        print("\n🔐 Testing Authentication...")
+        self._print("\n🔐 Testing Authentication...")
         
         # Test user registration
         test_user_data = {
-            "email": f"testuser_{datetime.now().strftime('%H%M%S')}@test.com",
+            "email": f"testuser_{uuid.uuid4().hex[:8]}@test.com",
             "password": "testpass123",
             "name": "Test User",
             "phone": "1234567890"
         }
         
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "User Registration",
             "POST",
             "auth/register",
             200,
-            data=test_user_data
+            data=test_user_data,
+            want_body=True
         )
         
         if success and 'token' in response:
             self.token = response['token']
             self.user_id = response['user']['id']
+            self._rebuild_headers()
         
-        # Test user login
-        login_success, login_response = self.run_test(
-            "User Login",
-            "POST",
-            "auth/login",
-            200,
-            data={"email": test_user_data["email"], "password": test_user_data["password"]}
-        )
-        
-        # Test admin login
-        admin_success, admin_response = self.run_test(
-            "Admin Login",
-            "POST",
-            "auth/login",
-            200,
-            data={"email": "admin@shop.com", "password": "admin123"}
-        )
-        
-        if admin_success and 'token' in admin_response:
-            self.admin_token = admin_response['token']
-            self.admin_id = admin_response['user']['id']
-        
-        # Test profile fetch
-        if self.token:
+        # Registration already yielded the working token, so the user login,
+        # admin login and profile fetch are independent of each other — run
+        # them concurrently instead of paying three sequential RTTs on the
+        # path every later section waits on
+        auth_calls = [
             self.run_test(
+                "User Login",
+                "POST",
+                "auth/login",
+                200,
+                data={"email": test_user_data["email"], "password": test_user_data["password"]}
+            ),
+            self.run_test(
+                "Admin Login",
+                "POST",
+                "auth/login",
+                200,
+                data={"email": "admin@shop.com", "password": "admin123"},
+                want_body=True
+            ),
+        ]
+        if self.token:
+            auth_calls.append(self.run_test(
                 "Get User Profile",
                 "GET",
                 "auth/profile",
                 200
-            )
+            ))
+        results = await asyncio.gather(*auth_calls)
+        (login_success, _), (admin_success, admin_response) = results[0], results[1]
+        
+        if admin_success and 'token' in admin_response:
+            self.admin_token = admin_response['token']
+            self.admin_id = admin_response['user']['id']
+            self._rebuild_headers()
         
         return success and login_success and admin_success
 
-    def test_products(self):
+    async def test_products(self):
         """Test product-related APIs"""
-        print("\n📦 Testing Product APIs...")
-        
-        # Test get all products
-        self.run_test(
-            "Get All Products",
-            "GET",
-            "products",
-            200
-        )
-        
-        # Test get products with filters
-        self.run_test(
-            "Get Products by Category",
-            "GET",
-            "products?category=Electronics",
-            200
-        )
-        
-        self.run_test(
-            "Get Products with Price Filter",
-            "GET",
-            "products?min_price=1000&max_price=5000",
-            200
-        )
-        
-        self.run_test(
-            "Search Products",
-            "GET",
-            "products?search=headphones",
-            200
-        )
+        self._print("\n📦 Testing Product APIs...")
         
-        # Test get categories
-        self.run_test(
-            "Get Categories",
-            "GET",
-            "categories",
-            200
+        # The listing, filter and category reads are independent; fan them out
+        await asyncio.gather(
+            self.run_test(
+                "Get All Products",
+                "GET",
+                "products",
+                200
+            ),
+            self.run_test(
+                "Get Products by Category",
+                "GET",
+                "products?category=Electronics",
+                200
+            ),
+            self.run_test(
+                "Get Products with Price Filter",
+                "GET",
+                "products?min_price=1000&max_price=5000",
+                200
+            ),
+            self.run_test(
+                "Search Products",
+                "GET",
+                "products?search=headphones",
+                200
+            ),
+            self.run_test(
+                "Get Categories",
+                "GET",
+                "categories",
+                200
+            )
         )
         
         # Get a product ID for further testing
-        success, products_response = self.run_test(
-            "Get Products for Testing",
-            "GET",
-            "products",
-            200
-        )
+        products_response = await self._get_products()
         
         product_id = None
-        if success and products_response and len(products_response) > 0:
+        if len(products_response) > 0:
             product_id = products_response[0]['id']
             
             # Test get single product
-            self.run_test(
+            await self.run_test(
                 "Get Single Product",
                 "GET",
                 f"products/{product_id}",
@@ -204,7 +267,7 @@ class ECommerceAPITester:
             )
             
             # Test get product reviews
-            self.run_test(
+            await self.run_test(
                 "Get Product Reviews",
                 "GET",
                 f"products/{product_id}/reviews",
@@ -213,7 +276,7 @@ class ECommerceAPITester:
             
             # Test add review (requires authentication)
             if self.token:
-                self.run_test(
+                await self.run_test(
                     "Add Product Review",
                     "POST",
                     f"products/{product_id}/review",
@@ -223,29 +286,24 @@ class ECommerceAPITester:
         
         return product_id is not None
 
-    def test_cart(self):
+    async def test_cart(self):
         """Test shopping cart APIs"""
-        print("\n🛒 Testing Cart APIs...")
+        self._print("\n🛒 Testing Cart APIs...")
         
         if not self.token:
-            print("❌ Skipping cart tests - no user token")
+            self._print("❌ Skipping cart tests - no user token")
             return False
         
         # Get a product for cart testing
-        success, products_response = self.run_test(
-            "Get Products for Cart",
-            "GET",
-            "products",
-            200
-        )
+        products_response = await self._get_products("Get Products for Cart")
         
-        if not success or not products_response:
+        if not products_response:
             return False
             
         product_id = products_response[0]['id']
         
         # Test add to cart
-        self.run_test(
+        await self.run_test(
             "Add Item to Cart",
             "POST",
             "cart/add",
@@ -254,7 +312,7 @@ class ECommerceAPITester:
         )
         
         # Test get cart
-        self.run_test(
+        await self.run_test(
             "Get Cart",
             "GET",
             "cart",
@@ -262,7 +320,7 @@ class ECommerceAPITester:
         )
         
         # Test update cart
-        self.run_test(
+        await self.run_test(
             "Update Cart Item",
             "PUT",
             "cart/update",
@@ -271,7 +329,7 @@ class ECommerceAPITester:
         )
         
         # Test remove from cart
-        self.run_test(
+        await self.run_test(
             "Remove Item from Cart",
             "DELETE",
             f"cart/remove/{product_id}",
@@ -279,7 +337,7 @@ class ECommerceAPITester:
         )
         
         # Add item back for order testing
-        self.run_test(
+        await self.run_test(
             "Add Item Back to Cart",
             "POST",
             "cart/add",
@@ -289,29 +347,24 @@ class ECommerceAPITester:
         
         return True
 
-    def test_wishlist(self):
+    async def test_wishlist(self):
         """Test wishlist APIs"""
-        print("\n❤️ Testing Wishlist APIs...")
+        self._print("\n❤️ Testing Wishlist APIs...")
         
         if not self.token:
-            print("❌ Skipping wishlist tests - no user token")
+            self._print("❌ Skipping wishlist tests - no user token")
             return False
         
         # Get a product for wishlist testing
-        success, products_response = self.run_test(
-            "Get Products for Wishlist",
-            "GET",
-            "products",
-            200
-        )
+        products_response = await self._get_products("Get Products for Wishlist")
         
-        if not success or not products_response:
+        if not products_response:
             return False
             
         product_id = products_response[0]['id']
         
         # Test add to wishlist
-        self.run_test(
+        await self.run_test(
             "Add to Wishlist",
             "POST",
             f"wishlist/add/{product_id}",
@@ -319,7 +372,7 @@ class ECommerceAPITester:
         )
         
         # Test get wishlist
-        self.run_test(
+        await self.run_test(
             "Get Wishlist",
             "GET",
             "wishlist",
@@ -327,7 +380,7 @@ class ECommerceAPITester:
         )
         
         # Test remove from wishlist
-        self.run_test(
+        await self.run_test(
             "Remove from Wishlist",
             "DELETE",
             f"wishlist/remove/{product_id}",
@@ -336,12 +389,12 @@ class ECommerceAPITester:
         
         return True
 
-    def test_address_management(self):
+    async def test_address_management(self):
         """Test address management"""
-        print("\n🏠 Testing Address Management...")
+        self._print("\n🏠 Testing Address Management...")
         
         if not self.token:
-            print("❌ Skipping address tests - no user token")
+            self._print("❌ Skipping address tests - no user token")
             return False
         
         # Test add address
@@ -355,66 +408,60 @@ class ECommerceAPITester:
             "is_default": True
         }
         
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "Add Address",
             "POST",
             "auth/address",
             200,
-            data=address_data
+            data=address_data,
+            want_body=True
         )
         
         if success and 'address' in response:
-            address_id = response['address']['id']
-            
-            # Test delete address
-            self.run_test(
-                "Delete Address",
-                "DELETE",
-                f"auth/address/{address_id}",
-                200
-            )
+            # Keep the address for test_orders to ship against; the delete
+            # coverage moves to the teardown after returns complete
+            self._shipping_address = response['address']
         
         return success
 
-    def test_orders(self):
+    async def test_orders(self):
         """Test order management"""
-        print("\n📋 Testing Order APIs...")
+        self._print("\n📋 Testing Order APIs...")
         
         if not self.token:
-            print("❌ Skipping order tests - no user token")
+            self._print("❌ Skipping order tests - no user token")
             return False
         
-        # First add address for shipping
-        address_data = {
-            "full_name": "Test User",
-            "phone": "1234567890",
-            "address_line": "123 Test Street",
-            "city": "Test City",
-            "state": "Test State",
-            "pincode": "123456",
-            "is_default": True
-        }
-        
-        addr_success, addr_response = self.run_test(
-            "Add Address for Order",
-            "POST",
-            "auth/address",
-            200,
-            data=address_data
-        )
-        
-        if not addr_success:
-            return False
+        # Reuse the address created in test_address_management; only pay
+        # the extra POST if that section didn't run or failed
+        if self._shipping_address is None:
+            address_data = {
+                "full_name": "Test User",
+                "phone": "1234567890",
+                "address_line": "123 Test Street",
+                "city": "Test City",
+                "state": "Test State",
+                "pincode": "123456",
+                "is_default": True
+            }
+            
+            addr_success, addr_response = await self.run_test(
+                "Add Address for Order",
+                "POST",
+                "auth/address",
+                200,
+                data=address_data,
+                want_body=True
+            )
+            
+            if not addr_success:
+                return False
+            self._shipping_address = addr_response['address']
         
         # Get products for order
-        success, products_response = self.run_test(
-            "Get Products for Order",
-            "GET",
-            "products",
-            200
-        )
+        products_response = await self._get_products("Get Products for Order")
         
-        if not success or not products_response:
+        if not products_response:
             return False
             
         product_id = products_response[0]['id']
@@ -422,24 +469,25 @@ class ECommerceAPITester:
         # Create order
         order_data = {
             "items": [{"product_id": product_id, "quantity": 1}],
-            "shipping_address": addr_response['address'],
+            "shipping_address": self._shipping_address,
             "payment_method": "upi",
             "discount_code": "SAVE10"
         }
         
-        order_success, order_response = self.run_test(
+        order_success, order_response = await self.run_test(
             "Create Order",
             "POST",
             "orders/create",
             200,
-            data=order_data
+            data=order_data,
+            want_body=True
         )
         
         if order_success and 'id' in order_response:
             self.created_order_id = order_response['id']
             
             # Test payment processing
-            self.run_test(
+            await self.run_test(
                 "Process Payment",
                 "POST",
                 f"orders/{self.created_order_id}/payment",
@@ -447,7 +495,7 @@ class ECommerceAPITester:
             )
             
             # Test get orders
-            self.run_test(
+            await self.run_test(
                 "Get User Orders",
                 "GET",
                 "orders",
@@ -455,7 +503,7 @@ class ECommerceAPITester:
             )
             
             # Test get single order
-            self.run_test(
+            await self.run_test(
                 "Get Single Order",
                 "GET",
                 f"orders/{self.created_order_id}",
@@ -464,17 +512,17 @@ class ECommerceAPITester:
         
         return order_success
 
-    def test_returns(self):
+    async def test_returns(self):
         """Test return system"""
-        print("\n🔄 Testing Return System...")
+        self._print("\n🔄 Testing Return System...")
         
         if not self.token or not self.created_order_id:
-            print("❌ Skipping return tests - no order to return")
+            self._print("❌ Skipping return tests - no order to return")
             return False
         
         # First update order status to delivered (admin action)
         if self.admin_token:
-            self.run_test(
+            await self.run_test(
                 "Update Order to Delivered",
                 "PUT",
                 f"admin/orders/{self.created_order_id}/status?status=delivered",
@@ -488,48 +536,50 @@ class ECommerceAPITester:
             "reason": "Product not as expected"
         }
         
-        self.run_test(
-            "Create Return Request",
-            "POST",
-            "returns/create",
-            200,
-            data=return_data
-        )
-        
-        # Test get returns
-        self.run_test(
-            "Get User Returns",
-            "GET",
-            "returns",
-            200
+        # The list call only checks status, not that it contains the new
+        # return, so it can overlap with the create on the same connection
+        await asyncio.gather(
+            self.run_test(
+                "Create Return Request",
+                "POST",
+                "returns/create",
+                200,
+                data=return_data
+            ),
+            self.run_test(
+                "Get User Returns",
+                "GET",
+                "returns",
+                200
+            )
         )
-        
+
         return True
 
-    def test_admin_apis(self):
+    async def test_admin_apis(self):
         """Test admin-specific APIs"""
-        print("\n👑 Testing Admin APIs...")
+        self._print("\n👑 Testing Admin APIs...")
         
         if not self.admin_token:
-            print("❌ Skipping admin tests - no admin token")
+            self._print("❌ Skipping admin tests - no admin token")
             return False
         
-        # Test admin analytics
-        self.run_test(
-            "Get Admin Analytics",
-            "GET",
-            "admin/analytics",
-            200,
-            use_admin=True
-        )
-        
-        # Test get all orders (admin)
-        self.run_test(
-            "Get All Orders (Admin)",
-            "GET",
-            "admin/orders",
-            200,
-            use_admin=True
+        # The admin reads are independent of each other; overlap them
+        await asyncio.gather(
+            self.run_test(
+                "Get Admin Analytics",
+                "GET",
+                "admin/analytics",
+                200,
+                use_admin=True
+            ),
+            self.run_test(
+                "Get All Orders (Admin)",
+                "GET",
+                "admin/orders",
+                200,
+                use_admin=True
+            )
         )
         
         # Test create product
@@ -544,13 +594,14 @@ class ECommerceAPITester:
             "stock": 10
         }
         
-        create_success, create_response = self.run_test(
+        create_success, create_response = await self.run_test(
             "Create Product (Admin)",
             "POST",
             "admin/products",
             200,
             data=product_data,
-            use_admin=True
+            use_admin=True,
+            want_body=True
         )
         
         if create_success and 'id' in create_response:
@@ -558,7 +609,7 @@ class ECommerceAPITester:
             
             # Test update product
             updated_data = {**product_data, "price": 899.99}
-            self.run_test(
+            await self.run_test(
                 "Update Product (Admin)",
                 "PUT",
                 f"admin/products/{self.created_product_id}",
@@ -568,51 +619,79 @@ class ECommerceAPITester:
             )
             
             # Test delete product
-            self.run_test(
+            await self.run_test(
                 "Delete Product (Admin)",
                 "DELETE",
                 f"admin/products/{self.created_product_id}",
                 200,
                 use_admin=True
             )
+            self._products_cache = None
         
         return create_success
 
-    def run_all_tests(self):
+    async def run_all_tests(self):
         """Run all API tests"""
-        print("🚀 Starting E-Commerce API Testing...")
-        print(f"Testing against: {self.base_url}")
-        
-        # Test in logical order
-        seed_success = self.test_seed_data()
-        auth_success = self.test_authentication()
-        products_success = self.test_products()
-        cart_success = self.test_cart()
-        wishlist_success = self.test_wishlist()
-        address_success = self.test_address_management()
-        orders_success = self.test_orders()
-        returns_success = self.test_returns()
-        admin_success = self.test_admin_apis()
+        self._print("🚀 Starting E-Commerce API Testing...")
+        self._print(f"Testing against: {self.base_url}")
+        
+        # Seed and auth first; the sections with no data dependency on each
+        # other run concurrently once the tokens exist. log_test is
+        # synchronous, so the shared counters can't interleave mid-update.
+        seed_success = await self.test_seed_data()
+        auth_success = await self.test_authentication()
+        self._flush_output()
+        results = await asyncio.gather(
+            self.test_products(),
+            self.test_cart(),
+            self.test_wishlist(),
+            self.test_address_management(),
+            self.test_admin_apis(),
+            return_exceptions=True
+        )
+        products_success, cart_success, wishlist_success, address_success, admin_success = [
+            result is True for result in results
+        ]
+        self._flush_output()
+        # Returns depend on the order created here; keep these sequential
+        orders_success = await self.test_orders()
+        returns_success = await self.test_returns()
+        
+        # Teardown: the shared shipping address is no longer needed
+        if self._shipping_address:
+            await self.run_test(
+                "Delete Address",
+                "DELETE",
+                f"auth/address/{self._shipping_address['id']}",
+                200
+            )
         
         # Print summary
-        print(f"\n📊 Test Summary:")
-        print(f"Tests Run: {self.tests_run}")
-        print(f"Tests Passed: {self.tests_passed}")
-        print(f"Success Rate: {(self.tests_passed/self.tests_run)*100:.1f}%")
-        
-        # Print failed tests
-        failed_tests = [test for test in self.test_results if not test['success']]
-        if failed_tests:
-            print(f"\n❌ Failed Tests ({len(failed_tests)}):")
-            for test in failed_tests:
-                print(f"  - {test['test']}: {test['details']}")
-        
-        return self.tests_passed == self.tests_run
+        self._print(f"\n📊 Test Summary:")
+        tests_passed = len(self._pass_names)
+        tests_run = tests_passed + len(self.failed_tests)
+        self._print(f"Tests Run: {tests_run}")
+        self._print(f"Tests Passed: {tests_passed}")
+        self._print(f"Success Rate: {(tests_passed/tests_run)*100:.1f}%")
+        
+        # Print failed tests (tracked incrementally in log_test)
+        if self.failed_tests:
+            self._print(f"\n❌ Failed Tests ({len(self.failed_tests)}):")
+            for test in self.failed_tests:
+                self._print(f"  - {test['test']}: {test['details']}")
+        
+        self._flush_output()
+        return not self.failed_tests
 
-def main():
-    tester = ECommerceAPITester()
-    success = tester.run_all_tests()
+async def main():
+    async with ECommerceAPITester() as tester:
+        success = await tester.run_all_tests()
     return 0 if success else 1
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass  # stock event loop (e.g. on Windows)
+    sys.exit(asyncio.run(main()))
\ No newline at end of file